@@ -1,7 +1,8 @@
 import asyncio
+from collections.abc import Iterable, Sequence
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
-from a2a.server.events import EventQueue
+from a2a.server.events import Event, EventQueue
 from a2a.types import (
     Message,
     TaskStatusUpdateEvent,
@@ -15,19 +16,67 @@ from a2a.utils import (
 )
 from datetime import datetime, timezone
 
+# Seconds to wait for room in a full event queue before giving up on a stalled consumer
+ENQUEUE_TIMEOUT = 5.0
+
+# Progress reports emitted by the simulated long-running task
+STILL_WORKING = tuple(f"Still working {i}" for i in range(4))
+
 
 def get_current_timestamp():
     """Get current timestamp in ISO 8601 format (UTC)"""
     return datetime.now(timezone.utc).isoformat()
 
 
+def make_status(
+    state: TaskState,
+    message: Message,
+) -> TaskStatus:
+    """Build a task status from already validated parts, skipping validation"""
+    return TaskStatus.model_construct(state=state, message=message)
+
+
+def make_status_update(
+    task_id: str,
+    context_id: str,
+    status: TaskStatus,
+    final: bool,
+) -> TaskStatusUpdateEvent:
+    """Build a status update event from already validated parts, skipping validation"""
+    return TaskStatusUpdateEvent.model_construct(
+        task_id=task_id,
+        context_id=context_id,
+        status=status,
+        final=final
+    )
+
+
+async def safe_enqueue(
+    event_queue: EventQueue,
+    event: Event,
+    timeout: float = ENQUEUE_TIMEOUT,
+) -> None:
+    """Enqueue an event, failing with TimeoutError instead of blocking forever on a full queue"""
+    await asyncio.wait_for(event_queue.enqueue_event(event), timeout)
+
+
+async def enqueue_events(
+    event_queue: EventQueue,
+    events: Iterable[Event],
+) -> None:
+    """Enqueue events in order, preserving the sequence clients observe"""
+    for event in events:
+        await safe_enqueue(event_queue, event)
+
+
 async def say_hello(
     event_queue: EventQueue,
     context: RequestContext,
 ) -> None:
     message = context.message
 
-    await event_queue.enqueue_event(
+    await safe_enqueue(
+        event_queue,
         new_agent_text_message(
             text="Hello World",
             context_id=message.context_id,
@@ -53,14 +102,13 @@ async def do_task(
         history=[message]
     )
 
-    # noinspection PyTypeChecker
     events = [
         task,
 
-        TaskStatusUpdateEvent(
-            context_id=task.context_id,
+        make_status_update(
             task_id=task.id,
-            status=TaskStatus(
+            context_id=task.context_id,
+            status=make_status(
                 state=TaskState.working,
                 message=new_agent_text_message(
                     text="Working on task",
@@ -71,10 +119,10 @@ async def do_task(
             final=False
         ),
 
-        TaskStatusUpdateEvent(
-            context_id=task.context_id,
+        make_status_update(
             task_id=task.id,
-            status=TaskStatus(
+            context_id=task.context_id,
+            status=make_status(
                 state=TaskState.completed,
                 message=new_agent_text_message(
                     text="Task completed",
@@ -86,8 +134,9 @@ async def do_task(
         )
     ]
 
-    for event in events:
-        await event_queue.enqueue_event(event)
+    # Enqueue sequentially: clients assert the task, working and completed
+    # events arrive in exactly this order, which concurrent enqueues would not guarantee.
+    await enqueue_events(event_queue, events)
 
 
 async def do_cancelable_task(
@@ -106,7 +155,45 @@ async def do_cancelable_task(
         ),
         history=[message]
     )
-    await event_queue.enqueue_event(task)
+    await safe_enqueue(event_queue, task)
+
+
+def simulate_progress(
+    progress_queue: asyncio.Queue[str],
+    reports: Sequence[str],
+    interval: float,
+) -> list[asyncio.TimerHandle]:
+    """Schedule progress reports on the event loop instead of sleeping between them"""
+    loop = asyncio.get_running_loop()
+
+    return [
+        loop.call_later(interval * (step + 1), progress_queue.put_nowait, report)
+        for step, report in enumerate(reports)
+    ]
+
+
+async def publish_progress(
+    event_queue: EventQueue,
+    task_id: str,
+    context_id: str,
+    text: str,
+) -> None:
+    await safe_enqueue(
+        event_queue,
+        make_status_update(
+            task_id=task_id,
+            context_id=context_id,
+            status=make_status(
+                state=TaskState.working,
+                message=new_agent_text_message(
+                    text=text,
+                    context_id=context_id,
+                    task_id=task_id
+                )
+            ),
+            final=False
+        )
+    )
 
 
 async def do_long_running_task(
@@ -126,28 +213,32 @@ async def do_long_running_task(
         history=[message]
     )
 
-    await event_queue.enqueue_event(task)
+    await safe_enqueue(event_queue, task)
 
-    # Simulate long-running task
-    for i in range(4):
-        await asyncio.sleep(0.2)
+    task_id = task.id
+    context_id = task.context_id
+
+    # Simulate long-running task: wake up only when a progress report arrives
+    progress_queue: asyncio.Queue[str] = asyncio.Queue()
+    handles = simulate_progress(progress_queue, STILL_WORKING, interval=0.2)
+
+    try:
+        for _ in STILL_WORKING:
+            text = await progress_queue.get()
+            await publish_progress(event_queue, task_id, context_id, text)
+    finally:
+        # Stop pending reports if the task is canceled mid-way
+        for handle in handles:
+            handle.cancel()
 
-        # noinspection PyTypeChecker
-        await event_queue.enqueue_event(
-            TaskStatusUpdateEvent(
-                task_id=task.id,
-                context_id=task.context_id,
-                status=TaskStatus(
-                    state=TaskState.working,
-                    message=new_agent_text_message(
-                        text=f"Still working {i}",
-                        context_id=task.context_id,
-                        task_id=task.id
-                    )
-                ),
-                final=False
-            )
-        )
+
+# Test scenarios to test various aspects of A2A, keyed by exact user input
+HANDLERS = {
+    "hello world": say_hello,
+    "do task": do_task,
+    "do cancelable task": do_cancelable_task,
+    "do long-running task": do_long_running_task,
+}
 
 
 class HelloWorldAgentExecutor(AgentExecutor):
@@ -158,23 +249,14 @@ class HelloWorldAgentExecutor(AgentExecutor):
         context: RequestContext,
         event_queue: EventQueue,
     ) -> None:
-        user_input = context.get_user_input()
-
-        # Test scenarios to test various aspects of A2A
-        if user_input == "hello world":
-            await say_hello(event_queue, context)
-
-        elif user_input == "do task":
-            await do_task(event_queue, context)
+        handler = HANDLERS.get(context.get_user_input())
 
-        elif user_input == "do cancelable task":
-            await do_cancelable_task(event_queue, context)
-
-        elif user_input == "do long-running task":
-            await do_long_running_task(event_queue, context)
+        if handler is not None:
+            await handler(event_queue, context)
 
         else:
-            await event_queue.enqueue_event(
+            await safe_enqueue(
+                event_queue,
                 new_agent_text_message("Sorry, I don't understand you")
             )
 
@@ -183,12 +265,12 @@ class HelloWorldAgentExecutor(AgentExecutor):
         context: RequestContext,
         event_queue: EventQueue
     ) -> None:
-        # noinspection PyTypeChecker
-        await event_queue.enqueue_event(
-            TaskStatusUpdateEvent(
-                context_id=context.context_id,
+        await safe_enqueue(
+            event_queue,
+            make_status_update(
                 task_id=context.task_id,
-                status=TaskStatus(
+                context_id=context.context_id,
+                status=make_status(
                     state=TaskState.canceled,
                     message=new_agent_text_message(
                         text="Task canceled",